@@ -5,13 +5,8 @@ import logging
 from pathlib import Path
 
 from g2nc.config import ConfigError, load_config
-from g2nc.google.client import GoogleCalendarClient
-from g2nc.google.oauth import bootstrap_token
 from g2nc.locking import FileLock
 from g2nc.logging_utils import configure_logging
-from g2nc.nextcloud.client import NextcloudCalendarClient
-from g2nc.state import SqliteStateRepository
-from g2nc.sync_service import SyncService
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -48,11 +43,18 @@ def main() -> int:
         return 0
 
     if args.command == "auth" and args.auth_command == "bootstrap":
+        from g2nc.google.oauth import bootstrap_token
+
         bootstrap_token(config.google, open_browser=not args.no_browser)
         logger.info("oauth bootstrap complete", extra={"token_file": str(config.google.token_file)})
         return 0
 
     if args.command == "sync":
+        from g2nc.google.client import GoogleCalendarClient
+        from g2nc.nextcloud.client import NextcloudCalendarClient
+        from g2nc.state import SqliteStateRepository
+        from g2nc.sync_service import SyncService
+
         state = SqliteStateRepository(config.sqlite_path)
         state.initialize()
 
@@ -60,9 +62,12 @@ def main() -> int:
         nextcloud = NextcloudCalendarClient(config.nextcloud)
         service = SyncService(google=google, nextcloud=nextcloud, state=state)
 
-        with FileLock(config.lock_file):
-            for mapping in config.mappings:
-                service.sync_mapping(mapping)
+        try:
+            with FileLock(config.lock_file):
+                for mapping in config.mappings:
+                    service.sync_mapping(mapping)
+        finally:
+            state.close()
         return 0
 
     parser.error("Unsupported command")
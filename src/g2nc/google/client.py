@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, cast
+from typing import Any, Final, cast
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -11,6 +11,11 @@ from googleapiclient.errors import HttpError
 from g2nc.models import CalendarChanges, CalendarEvent, GoogleAuthConfig
 from g2nc.ports import SyncTokenInvalidatedError
 
+EVENT_LIST_FIELDS: Final[str] = (
+    "nextPageToken,nextSyncToken,"
+    "items(id,status,summary,description,location,start,end,recurrence)"
+)
+
 
 class GoogleAuthError(RuntimeError):
     pass
@@ -19,13 +24,15 @@ class GoogleAuthError(RuntimeError):
 class GoogleCalendarClient:
     def __init__(self, auth: GoogleAuthConfig) -> None:
         self._auth = auth
+        self._service: Any | None = None
 
     def fetch_event_changes(self, calendar_id: str, sync_token: str | None) -> CalendarChanges:
-        service = self._build_service()
+        events_api = self._get_service().events()
         params: dict[str, Any] = {
             "calendarId": calendar_id,
             "showDeleted": True,
             "maxResults": 2500,
+            "fields": EVENT_LIST_FIELDS,
         }
         if sync_token:
             params["syncToken"] = sync_token
@@ -40,7 +47,6 @@ class GoogleCalendarClient:
             else:
                 params.pop("pageToken", None)
 
-            events_api = service.events()
             request = events_api.list(**params)
             try:
                 response = request.execute()
@@ -68,13 +74,19 @@ class GoogleCalendarClient:
 
         return CalendarChanges(events=tuple(events), next_sync_token=next_sync_token)
 
+    def _get_service(self) -> Any:
+        if self._service is None:
+            self._service = self._build_service()
+        return self._service
+
     def _build_service(self) -> Any:
-        if not self._auth.token_file.exists():
+        try:
+            token_payload = self._auth.token_file.read_text(encoding="utf-8")
+        except FileNotFoundError as exc:
             raise GoogleAuthError(
                 f"Google token file not found: {self._auth.token_file}. Run auth bootstrap first."
-            )
+            ) from exc
 
-        token_payload = self._auth.token_file.read_text(encoding="utf-8")
         token_data = json.loads(token_payload)
         if not isinstance(token_data, dict):
             raise GoogleAuthError("token file JSON must be an object")
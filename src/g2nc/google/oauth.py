@@ -3,8 +3,6 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from google_auth_oauthlib.flow import InstalledAppFlow
-
 from g2nc.models import GoogleAuthConfig
 
 
@@ -52,6 +50,8 @@ def load_client_config(auth: GoogleAuthConfig) -> dict[str, Any]:
 
 
 def bootstrap_token(auth: GoogleAuthConfig, open_browser: bool) -> None:
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     config = load_client_config(auth)
     flow = InstalledAppFlow.from_client_config(config, list(auth.scopes))
     credentials = flow.run_local_server(open_browser=open_browser)
@@ -5,6 +5,10 @@ import logging
 import sys
 from datetime import UTC, datetime
 
+_RESERVED_ATTRS: frozenset[str] = frozenset(
+    vars(logging.LogRecord("", logging.NOTSET, "", 0, "", (), None))
+) | {"message", "asctime"}
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
@@ -17,30 +21,7 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info is not None:
             payload["exception"] = self.formatException(record.exc_info)
         for key, value in record.__dict__.items():
-            if key.startswith("_"):
-                continue
-            if key in {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-            }:
+            if key.startswith("_") or key in _RESERVED_ATTRS:
                 continue
             payload[key] = value
         return json.dumps(payload, separators=(",", ":"), sort_keys=True)
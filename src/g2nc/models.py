@@ -46,7 +46,7 @@ class AppConfig:
     mappings: tuple[CalendarMapping, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalendarEvent:
     google_event_id: str
     deleted: bool
@@ -65,7 +65,7 @@ class CalendarChanges:
     next_sync_token: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventState:
     mapping_key: str
     google_event_id: str
@@ -75,7 +75,7 @@ class EventState:
     payload_hash: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpsertResult:
     href: str
     etag: str | None
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import io
 import urllib.parse
 from dataclasses import dataclass
 from typing import Final
 from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 
 from requests import Response, Session
 
@@ -12,6 +14,28 @@ from g2nc.transform import render_ics
 
 DAV_NAMESPACE: Final[str] = "DAV:"
 
+_DAV_RESPONSE: Final[str] = f"{{{DAV_NAMESPACE}}}response"
+_DAV_HREF: Final[str] = f"{{{DAV_NAMESPACE}}}href"
+_DAV_PROPSTAT: Final[str] = f"{{{DAV_NAMESPACE}}}propstat"
+_DAV_PROP: Final[str] = f"{{{DAV_NAMESPACE}}}prop"
+_DAV_GETETAG: Final[str] = f"{{{DAV_NAMESPACE}}}getetag"
+
+_UID_QUERY_TEMPLATE: Final[str] = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">'
+    "<d:prop><d:getetag/><d:href/></d:prop>"
+    "<c:filter>"
+    '<c:comp-filter name="VCALENDAR">'
+    '<c:comp-filter name="VEVENT">'
+    '<c:prop-filter name="UID">'
+    '<c:text-match collation="i;octet" match-type="equals">{uid}</c:text-match>'
+    "</c:prop-filter>"
+    "</c:comp-filter>"
+    "</c:comp-filter>"
+    "</c:filter>"
+    "</c:calendar-query>"
+)
+
 
 class NextcloudError(RuntimeError):
     pass
@@ -37,17 +61,17 @@ class NextcloudCalendarClient:
         known_href: str | None,
         known_etag: str | None,
     ) -> UpsertResult:
-        ics = render_ics(uid, event)
-        existing = self._find_event_by_uid(calendar_url, uid)
+        body = render_ics(uid, event).encode("utf-8")
 
         href = known_href
         etag = known_etag
-        if existing is not None:
-            href = existing.href
-            etag = existing.etag
-
         if href is None:
-            href = self._href_from_uid(uid)
+            existing = self._find_event_by_uid(calendar_url, uid)
+            if existing is not None:
+                href = existing.href
+                etag = existing.etag
+            else:
+                href = self._href_from_uid(uid)
 
         target_url = urllib.parse.urljoin(_ensure_trailing_slash(calendar_url), href)
         headers: dict[str, str] = {"Content-Type": "text/calendar; charset=utf-8"}
@@ -56,17 +80,20 @@ class NextcloudCalendarClient:
 
         response = self._session.put(
             target_url,
-            data=ics.encode("utf-8"),
+            data=body,
             headers=headers,
             timeout=self._timeout,
         )
         if response.status_code == 412 and etag is not None:
             latest = self._find_event_by_uid(calendar_url, uid)
             if latest is not None:
-                headers["If-Match"] = latest.etag if latest.etag is not None else "*"
+                if latest.href != href:
+                    href = latest.href
+                    target_url = urllib.parse.urljoin(_ensure_trailing_slash(calendar_url), href)
+                headers = {**headers, "If-Match": latest.etag if latest.etag is not None else "*"}
                 response = self._session.put(
                     target_url,
-                    data=ics.encode("utf-8"),
+                    data=body,
                     headers=headers,
                     timeout=self._timeout,
                 )
@@ -88,21 +115,7 @@ class NextcloudCalendarClient:
 
     def _find_event_by_uid(self, calendar_url: str, uid: str) -> _RemoteEvent | None:
         url = _ensure_trailing_slash(calendar_url)
-        report_body = (
-            '<?xml version="1.0" encoding="UTF-8"?>'
-            '<c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">'
-            "<d:prop><d:getetag/><d:href/></d:prop>"
-            "<c:filter>"
-            '<c:comp-filter name="VCALENDAR">'
-            '<c:comp-filter name="VEVENT">'
-            '<c:prop-filter name="UID">'
-            f'<c:text-match collation="i;octet" match-type="equals">{uid}</c:text-match>'
-            "</c:prop-filter>"
-            "</c:comp-filter>"
-            "</c:comp-filter>"
-            "</c:filter>"
-            "</c:calendar-query>"
-        )
+        report_body = _UID_QUERY_TEMPLATE.format(uid=escape(uid))
         response = self._session.request(
             method="REPORT",
             url=url,
@@ -115,26 +128,14 @@ class NextcloudCalendarClient:
         )
         self._assert_success(response, {207}, "REPORT", url)
 
-        root = ElementTree.fromstring(response.content)
-        for node in root.findall(f"{{{DAV_NAMESPACE}}}response"):
-            href_node = node.find(f"{{{DAV_NAMESPACE}}}href")
-            if href_node is None or href_node.text is None:
+        calendar_path = urllib.parse.urlparse(url).path
+        for _, node in ElementTree.iterparse(io.BytesIO(response.content), events=("end",)):
+            if node.tag != _DAV_RESPONSE:
                 continue
-            href_value = href_node.text
-            propstat = node.find(f"{{{DAV_NAMESPACE}}}propstat")
-            if propstat is None:
-                continue
-            prop = propstat.find(f"{{{DAV_NAMESPACE}}}prop")
-            if prop is None:
-                continue
-            etag_node = prop.find(f"{{{DAV_NAMESPACE}}}getetag")
-            etag = etag_node.text if etag_node is not None else None
-            parsed = urllib.parse.urlparse(href_value)
-            href_path = parsed.path
-            calendar_path = urllib.parse.urlparse(url).path
-            normalized = href_path.replace(calendar_path, "", 1).lstrip("/")
-            if normalized:
-                return _RemoteEvent(href=normalized, etag=etag)
+            remote = _remote_event_from_response(node, calendar_path)
+            node.clear()
+            if remote is not None:
+                return remote
         return None
 
     def _href_from_uid(self, uid: str) -> str:
@@ -153,6 +154,27 @@ class NextcloudCalendarClient:
             )
 
 
+def _remote_event_from_response(
+    node: ElementTree.Element, calendar_path: str
+) -> _RemoteEvent | None:
+    href_node = node.find(_DAV_HREF)
+    if href_node is None or href_node.text is None:
+        return None
+    propstat = node.find(_DAV_PROPSTAT)
+    if propstat is None:
+        return None
+    prop = propstat.find(_DAV_PROP)
+    if prop is None:
+        return None
+    etag_node = prop.find(_DAV_GETETAG)
+    etag = etag_node.text if etag_node is not None else None
+    href_path = urllib.parse.urlparse(href_node.text).path
+    normalized = href_path.replace(calendar_path, "", 1).lstrip("/")
+    if not normalized:
+        return None
+    return _RemoteEvent(href=normalized, etag=etag)
+
+
 def _ensure_trailing_slash(value: str) -> str:
     if value.endswith("/"):
         return value
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import sqlite3
-from collections.abc import Iterator
+import weakref
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -11,6 +12,9 @@ from g2nc.models import EventState
 class SqliteStateRepository:
     def __init__(self, sqlite_path: Path) -> None:
         self._sqlite_path = sqlite_path
+        self._conn: sqlite3.Connection | None = None
+        self._finalizer: weakref.finalize[[], SqliteStateRepository] | None = None
+        self._in_transaction = False
 
     def initialize(self) -> None:
         self._sqlite_path.parent.mkdir(parents=True, exist_ok=True)
@@ -19,7 +23,7 @@ class SqliteStateRepository:
                 CREATE TABLE IF NOT EXISTS calendar_state (
                     mapping_key TEXT PRIMARY KEY,
                     sync_token TEXT
-                )
+                ) WITHOUT ROWID
                 """)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS event_state (
@@ -30,7 +34,7 @@ class SqliteStateRepository:
                     etag TEXT,
                     payload_hash TEXT NOT NULL,
                     PRIMARY KEY (mapping_key, google_event_id)
-                )
+                ) WITHOUT ROWID
                 """)
 
     def get_sync_token(self, mapping_key: str) -> str | None:
@@ -86,8 +90,24 @@ class SqliteStateRepository:
             )
 
     def upsert_event_state(self, state: EventState) -> None:
+        self.upsert_event_states((state,))
+
+    def upsert_event_states(self, states: Iterable[EventState]) -> None:
+        rows = [
+            (
+                state.mapping_key,
+                state.google_event_id,
+                state.uid,
+                state.href,
+                state.etag,
+                state.payload_hash,
+            )
+            for state in states
+        ]
+        if not rows:
+            return
         with self._connection() as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO event_state (
                     mapping_key,
@@ -104,28 +124,49 @@ class SqliteStateRepository:
                               etag = excluded.etag,
                               payload_hash = excluded.payload_hash
                 """,
-                (
-                    state.mapping_key,
-                    state.google_event_id,
-                    state.uid,
-                    state.href,
-                    state.etag,
-                    state.payload_hash,
-                ),
+                rows,
             )
 
     def delete_event_state(self, mapping_key: str, google_event_id: str) -> None:
+        self.delete_event_states(mapping_key, (google_event_id,))
+
+    def delete_event_states(self, mapping_key: str, google_event_ids: Iterable[str]) -> None:
+        rows = [(mapping_key, google_event_id) for google_event_id in google_event_ids]
+        if not rows:
+            return
         with self._connection() as conn:
-            conn.execute(
+            conn.executemany(
                 "DELETE FROM event_state WHERE mapping_key = ? AND google_event_id = ?",
-                (mapping_key, google_event_id),
+                rows,
             )
 
+    def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._conn = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        if self._in_transaction:
+            yield
+            return
+        with self._connection():
+            self._in_transaction = True
+            try:
+                yield
+            finally:
+                self._in_transaction = False
+
     @contextmanager
     def _connection(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(self._sqlite_path)
-        try:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._sqlite_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._finalizer = weakref.finalize(self, self._conn.close)
+        if self._in_transaction:
+            yield self._conn
+            return
+        with self._conn as conn:
             yield conn
-            conn.commit()
-        finally:
-            conn.close()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import logging
+from typing import Final
 
-from g2nc.models import CalendarMapping, EventState
+from g2nc.models import CalendarEvent, CalendarMapping, EventState
 from g2nc.ports import GoogleCalendarPort, NextcloudCalendarPort, SyncTokenInvalidatedError
 from g2nc.state import SqliteStateRepository
 from g2nc.transform import event_payload_hash, event_uid
 
+STATE_FLUSH_BATCH_SIZE: Final[int] = 500
+
 
 class SyncService:
     def __init__(
@@ -34,8 +37,33 @@ class SyncService:
             self._state.clear_sync_token(mapping.mapping_key)
             changes = self._google.fetch_event_changes(mapping.google_calendar_id, None)
 
-        for event in changes.events:
-            state_row = self._state.get_event_state(mapping.mapping_key, event.google_event_id)
+        pending: dict[str, EventState | None] = {}
+        completed = False
+        try:
+            self._apply_changes(mapping, changes.events, pending)
+            completed = True
+        finally:
+            with self._state.transaction():
+                self._flush_event_states(mapping.mapping_key, pending)
+                if completed:
+                    self._state.set_sync_token(mapping.mapping_key, changes.next_sync_token)
+        self._logger.info("sync mapping completed", extra={"mapping": mapping.name})
+
+    def _apply_changes(
+        self,
+        mapping: CalendarMapping,
+        events: tuple[CalendarEvent, ...],
+        pending: dict[str, EventState | None],
+    ) -> None:
+        for event in events:
+            if len(pending) >= STATE_FLUSH_BATCH_SIZE:
+                with self._state.transaction():
+                    self._flush_event_states(mapping.mapping_key, pending)
+                pending.clear()
+            if event.google_event_id in pending:
+                state_row = pending[event.google_event_id]
+            else:
+                state_row = self._state.get_event_state(mapping.mapping_key, event.google_event_id)
             if event.deleted:
                 if state_row is not None:
                     self._nextcloud.delete_event(
@@ -43,7 +71,7 @@ class SyncService:
                         href=state_row.href,
                         etag=state_row.etag,
                     )
-                    self._state.delete_event_state(mapping.mapping_key, event.google_event_id)
+                    pending[event.google_event_id] = None
                 continue
 
             uid = event_uid(mapping.google_calendar_id, event.google_event_id)
@@ -58,16 +86,18 @@ class SyncService:
                 known_href=state_row.href if state_row is not None else None,
                 known_etag=state_row.etag if state_row is not None else None,
             )
-            self._state.upsert_event_state(
-                EventState(
-                    mapping_key=mapping.mapping_key,
-                    google_event_id=event.google_event_id,
-                    uid=uid,
-                    href=result.href,
-                    etag=result.etag,
-                    payload_hash=payload_hash,
-                )
+            pending[event.google_event_id] = EventState(
+                mapping_key=mapping.mapping_key,
+                google_event_id=event.google_event_id,
+                uid=uid,
+                href=result.href,
+                etag=result.etag,
+                payload_hash=payload_hash,
             )
 
-        self._state.set_sync_token(mapping.mapping_key, changes.next_sync_token)
-        self._logger.info("sync mapping completed", extra={"mapping": mapping.name})
+    def _flush_event_states(self, mapping_key: str, pending: dict[str, EventState | None]) -> None:
+        self._state.delete_event_states(
+            mapping_key,
+            [google_event_id for google_event_id, row in pending.items() if row is None],
+        )
+        self._state.upsert_event_states([row for row in pending.values() if row is not None])
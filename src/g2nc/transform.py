@@ -6,6 +6,16 @@ from datetime import UTC, datetime
 
 from g2nc.models import CalendarEvent
 
+_ICS_HEADER: tuple[str, ...] = (
+    "BEGIN:VCALENDAR",
+    "VERSION:2.0",
+    "PRODID:-//g2nc//EN",
+    "BEGIN:VEVENT",
+)
+_ICS_FOOTER: tuple[str, ...] = ("END:VEVENT", "END:VCALENDAR", "")
+_ICS_MAX_LINE_OCTETS = 75
+_ICS_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+
 
 def event_uid(google_calendar_id: str, google_event_id: str) -> str:
     seed = f"{google_calendar_id}:{google_event_id}".encode()
@@ -25,21 +35,35 @@ def event_payload_hash(event: CalendarEvent) -> str:
         "all_day": event.all_day,
         "recurrence": list(event.recurrence),
     }
-    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
-    return digest
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
 
 def _escape_ics_text(value: str) -> str:
-    escaped = value.replace("\\", "\\\\")
-    escaped = escaped.replace(";", "\\;")
-    escaped = escaped.replace(",", "\\,")
-    escaped = escaped.replace("\n", "\\n")
-    return escaped
+    return value.translate(_ICS_TEXT_ESCAPES)
+
+
+def _fold_line(line: str) -> str:
+    encoded = line.encode("utf-8")
+    if len(encoded) <= _ICS_MAX_LINE_OCTETS:
+        return line
+
+    chunks: list[bytes] = []
+    start = 0
+    limit = _ICS_MAX_LINE_OCTETS
+    while len(encoded) - start > limit:
+        end = start + limit
+        while encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        chunks.append(encoded[start:end])
+        start = end
+        limit = _ICS_MAX_LINE_OCTETS - 1
+    chunks.append(encoded[start:])
+    return b"\r\n ".join(chunks).decode("utf-8")
 
 
 def _parse_datetime(value: str) -> datetime:
-    normalized = value.replace("Z", "+00:00")
-    parsed = datetime.fromisoformat(normalized)
+    parsed = datetime.fromisoformat(value)
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=UTC)
     return parsed.astimezone(UTC)
@@ -50,7 +74,7 @@ def _format_date(value: str) -> str:
 
 
 def render_ics(uid: str, event: CalendarEvent) -> str:
-    lines: list[str] = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//g2nc//EN", "BEGIN:VEVENT"]
+    lines: list[str] = list(_ICS_HEADER)
     now_utc = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%SZ")
     lines.append(f"DTSTAMP:{now_utc}")
     lines.append(f"UID:{uid}")
@@ -76,5 +100,5 @@ def render_ics(uid: str, event: CalendarEvent) -> str:
         if recurrence.startswith("RRULE:"):
             lines.append(recurrence)
 
-    lines.extend(["END:VEVENT", "END:VCALENDAR", ""])
-    return "\r\n".join(lines)
+    lines.extend(_ICS_FOOTER)
+    return "\r\n".join(_fold_line(line) for line in lines)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -61,7 +63,7 @@ def test_auth_bootstrap_command(tmp_path: Path, monkeypatch: pytest.MonkeyPatch)
     monkeypatch.setattr("g2nc.cli.load_config", lambda path: config)
     monkeypatch.setattr("g2nc.cli.configure_logging", lambda level, use_json: None)
     monkeypatch.setattr(
-        "g2nc.cli.bootstrap_token",
+        "g2nc.google.oauth.bootstrap_token",
         lambda auth, open_browser: called.__setitem__("bootstrap", not open_browser),
     )
 
@@ -74,9 +76,14 @@ def test_sync_command_runs_all_mappings(tmp_path: Path, monkeypatch: pytest.Monk
     sync_calls: list[str] = []
 
     class _StateStub:
+        closed = False
+
         def initialize(self) -> None:
             return None
 
+        def close(self) -> None:
+            self.closed = True
+
     class _ServiceStub:
         def sync_mapping(self, mapping: CalendarMapping) -> None:
             sync_calls.append(mapping.name)
@@ -94,11 +101,28 @@ def test_sync_command_runs_all_mappings(tmp_path: Path, monkeypatch: pytest.Monk
     monkeypatch.setattr("sys.argv", ["g2nc", "--config", "settings.json", "sync"])
     monkeypatch.setattr("g2nc.cli.load_config", lambda path: config)
     monkeypatch.setattr("g2nc.cli.configure_logging", lambda level, use_json: None)
-    monkeypatch.setattr("g2nc.cli.SqliteStateRepository", lambda path: _StateStub())
-    monkeypatch.setattr("g2nc.cli.GoogleCalendarClient", lambda auth: object())
-    monkeypatch.setattr("g2nc.cli.NextcloudCalendarClient", lambda nextcloud: object())
-    monkeypatch.setattr("g2nc.cli.SyncService", lambda google, nextcloud, state: _ServiceStub())
+    state = _StateStub()
+    monkeypatch.setattr("g2nc.state.SqliteStateRepository", lambda path: state)
+    monkeypatch.setattr("g2nc.google.client.GoogleCalendarClient", lambda auth: object())
+    monkeypatch.setattr("g2nc.nextcloud.client.NextcloudCalendarClient", lambda nextcloud: object())
+    monkeypatch.setattr(
+        "g2nc.sync_service.SyncService", lambda google, nextcloud, state: _ServiceStub()
+    )
     monkeypatch.setattr("g2nc.cli.FileLock", _LockStub)
 
     assert main() == 0
     assert sync_calls == ["work"]
+    assert state.closed is True
+
+
+def test_cli_import_does_not_load_sync_dependencies() -> None:
+    code = (
+        "import sys, g2nc.cli; "
+        "loaded = [m for m in ('googleapiclient', 'requests', 'sqlite3') if m in sys.modules]; "
+        "print(','.join(loaded))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == ""
@@ -7,7 +7,7 @@ from typing import Any
 
 import pytest
 
-from g2nc.google.client import GoogleAuthError, GoogleCalendarClient
+from g2nc.google.client import EVENT_LIST_FIELDS, GoogleAuthError, GoogleCalendarClient
 from g2nc.models import GoogleAuthConfig
 from g2nc.ports import SyncTokenInvalidatedError
 
@@ -99,9 +99,33 @@ def test_fetch_event_changes_handles_pages_and_deleted_events(
     assert [event.google_event_id for event in changes.events] == ["evt-1", "evt-2"]
     assert changes.events[1].deleted is True
     assert service.events().calls[0]["syncToken"] == "sync-1"
+    assert service.events().calls[0]["fields"] == EVENT_LIST_FIELDS
     assert service.events().calls[1]["pageToken"] == "page-2"
 
 
+def test_fetch_event_changes_reuses_service_across_calls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = GoogleCalendarClient(_auth(tmp_path))
+    service = _FakeService(
+        [
+            {"items": [], "nextSyncToken": "sync-a"},
+            {"items": [], "nextSyncToken": "sync-b"},
+        ]
+    )
+    builds: list[_FakeService] = []
+
+    def build_service() -> _FakeService:
+        builds.append(service)
+        return service
+
+    monkeypatch.setattr(client, "_build_service", build_service)
+
+    assert client.fetch_event_changes("calendar-a", None).next_sync_token == "sync-a"
+    assert client.fetch_event_changes("calendar-b", None).next_sync_token == "sync-b"
+    assert len(builds) == 1
+
+
 def test_fetch_event_changes_raises_on_410(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     client = GoogleCalendarClient(_auth(tmp_path))
     service = _FakeService([_HttpError(410)])
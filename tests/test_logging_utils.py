@@ -28,6 +28,23 @@ def test_json_formatter_includes_extra_fields() -> None:
     assert payload["level"] == "INFO"
 
 
+def test_json_formatter_omits_standard_record_attributes() -> None:
+    record = logging.LogRecord(
+        name="g2nc.test",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="hello %s",
+        args=("world",),
+        exc_info=None,
+    )
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert set(payload) == {"timestamp", "level", "logger", "message"}
+    assert payload["message"] == "hello world"
+
+
 def test_configure_logging_plain_text() -> None:
     root = logging.getLogger()
     original_handlers = list(root.handlers)
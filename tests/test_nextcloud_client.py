@@ -82,9 +82,55 @@ def test_upsert_event_creates_when_uid_not_found() -> None:
     assert result.href == "uid-1.ics"
     assert result.etag == '"etag-1"'
     assert session.requests[0][0] == "REPORT"
+    assert b">uid-1</c:text-match>" in session.requests[0][2]["data"]
     assert session.puts[0][0].endswith("uid-1.ics")
 
 
+def test_find_event_by_uid_escapes_uid_in_report_body() -> None:
+    client = NextcloudCalendarClient(
+        NextcloudConfig(username="alice", app_password="secret", timeout_seconds=30)
+    )
+    session = _SessionStub(report_responses=[_response(207, '<d:multistatus xmlns:d="DAV:" />')])
+    client._session = session
+
+    assert client._find_event_by_uid("https://cloud.example/cal/", "a&b<c>") is None
+    assert b">a&amp;b&lt;c&gt;</c:text-match>" in session.requests[0][2]["data"]
+
+
+def test_upsert_event_uses_first_matching_report_entry() -> None:
+    client = NextcloudCalendarClient(
+        NextcloudConfig(username="alice", app_password="secret", timeout_seconds=30)
+    )
+    report_xml = (
+        '<d:multistatus xmlns:d="DAV:">'
+        "<d:response>"
+        "<d:href>/remote.php/dav/calendars/alice/work/</d:href>"
+        '<d:propstat><d:prop><d:getetag>"collection"</d:getetag></d:prop></d:propstat>'
+        "</d:response>"
+        "<d:response>"
+        "<d:href>/remote.php/dav/calendars/alice/work/other-name.ics</d:href>"
+        '<d:propstat><d:prop><d:getetag>"remote"</d:getetag></d:prop></d:propstat>'
+        "</d:response>"
+        "</d:multistatus>"
+    )
+    session = _SessionStub(
+        report_responses=[_response(207, report_xml)],
+        put_responses=[_response(204, headers={"ETag": '"updated"'})],
+    )
+    client._session = session
+
+    result = client.upsert_event(
+        calendar_url="https://cloud.example/remote.php/dav/calendars/alice/work/",
+        uid="uid-1",
+        event=_event(),
+        known_href=None,
+        known_etag=None,
+    )
+
+    assert result.href == "other-name.ics"
+    assert session.puts[0][1]["If-Match"] == '"remote"'
+
+
 def test_upsert_event_retries_with_latest_etag_on_precondition_failure() -> None:
     client = NextcloudCalendarClient(
         NextcloudConfig(username="alice", app_password="secret", timeout_seconds=30)
@@ -98,7 +144,7 @@ def test_upsert_event_retries_with_latest_etag_on_precondition_failure() -> None
         "</d:multistatus>"
     )
     session = _SessionStub(
-        report_responses=[_response(207, report_xml), _response(207, report_xml)],
+        report_responses=[_response(207, report_xml)],
         put_responses=[_response(412), _response(204, headers={"ETag": '"fresh"'})],
     )
     client._session = session
@@ -112,10 +158,66 @@ def test_upsert_event_retries_with_latest_etag_on_precondition_failure() -> None
     )
 
     assert result.href == "uid-1.ics"
-    assert session.puts[0][1]["If-Match"] == '"fresh"'
+    assert len(session.requests) == 1
+    assert session.puts[0][1]["If-Match"] == '"stale"'
+    assert session.puts[1][1]["If-Match"] == '"fresh"'
+
+
+def test_upsert_event_retries_at_moved_href_on_precondition_failure() -> None:
+    client = NextcloudCalendarClient(
+        NextcloudConfig(username="alice", app_password="secret", timeout_seconds=30)
+    )
+    report_xml = (
+        '<d:multistatus xmlns:d="DAV:">'
+        "<d:response>"
+        "<d:href>/remote.php/dav/calendars/alice/work/moved.ics</d:href>"
+        '<d:propstat><d:prop><d:getetag>"fresh"</d:getetag></d:prop></d:propstat>'
+        "</d:response>"
+        "</d:multistatus>"
+    )
+    session = _SessionStub(
+        report_responses=[_response(207, report_xml)],
+        put_responses=[_response(412), _response(204, headers={"ETag": '"fresh-2"'})],
+    )
+    client._session = session
+
+    result = client.upsert_event(
+        calendar_url="https://cloud.example/remote.php/dav/calendars/alice/work/",
+        uid="uid-1",
+        event=_event(),
+        known_href="uid-1.ics",
+        known_etag='"stale"',
+    )
+
+    assert result.href == "moved.ics"
+    assert result.etag == '"fresh-2"'
+    assert session.puts[0][0].endswith("/work/uid-1.ics")
+    assert session.puts[1][0].endswith("/work/moved.ics")
     assert session.puts[1][1]["If-Match"] == '"fresh"'
 
 
+def test_upsert_event_with_known_href_skips_report() -> None:
+    client = NextcloudCalendarClient(
+        NextcloudConfig(username="alice", app_password="secret", timeout_seconds=30)
+    )
+    session = _SessionStub(put_responses=[_response(204, headers={"ETag": '"etag-2"'})])
+    client._session = session
+
+    result = client.upsert_event(
+        calendar_url="https://cloud.example/remote.php/dav/calendars/alice/work/",
+        uid="uid-1",
+        event=_event(),
+        known_href="custom-href.ics",
+        known_etag='"etag-1"',
+    )
+
+    assert result.href == "custom-href.ics"
+    assert result.etag == '"etag-2"'
+    assert session.requests == []
+    assert session.puts[0][0].endswith("custom-href.ics")
+    assert session.puts[0][1]["If-Match"] == '"etag-1"'
+
+
 def test_delete_event_treats_404_as_success() -> None:
     client = NextcloudCalendarClient(
         NextcloudConfig(username="alice", app_password="secret", timeout_seconds=30)
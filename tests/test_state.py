@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import gc
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from g2nc.models import EventState
+from g2nc.state import SqliteStateRepository
+
+
+def _state(tmp_path: Path) -> SqliteStateRepository:
+    repo = SqliteStateRepository(tmp_path / "state.sqlite")
+    repo.initialize()
+    return repo
+
+
+def test_state_repository_reuses_connection_until_closed(tmp_path: Path) -> None:
+    state = _state(tmp_path)
+    state.set_sync_token("key", "token-1")
+    first_connection = state._conn
+
+    assert state.get_sync_token("key") == "token-1"
+    assert state._conn is first_connection
+
+    state.close()
+    assert state._conn is None
+    assert state.get_sync_token("key") == "token-1"
+
+
+def test_state_repository_uses_wal_journal(tmp_path: Path) -> None:
+    state = _state(tmp_path)
+
+    with state._connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert conn.execute("PRAGMA synchronous").fetchone() == (1,)
+
+
+def test_state_repository_closes_connection_when_collected(tmp_path: Path) -> None:
+    state = _state(tmp_path)
+    connection = state._conn
+    assert connection is not None
+
+    del state
+    gc.collect()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+
+
+def test_transaction_commits_writes_once_at_exit(tmp_path: Path) -> None:
+    state = _state(tmp_path)
+    reader = SqliteStateRepository(tmp_path / "state.sqlite")
+
+    with state.transaction():
+        state.set_sync_token("key", "token-1")
+        state.upsert_event_state(
+            EventState(
+                mapping_key="key",
+                google_event_id="evt-1",
+                uid="uid-1",
+                href="uid-1.ics",
+                etag=None,
+                payload_hash="hash",
+            )
+        )
+        assert reader.get_sync_token("key") is None
+
+    assert reader.get_sync_token("key") == "token-1"
+    assert reader.get_event_state("key", "evt-1") is not None
+
+
+def test_transaction_rolls_back_all_writes_on_error(tmp_path: Path) -> None:
+    state = _state(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with state.transaction():
+            state.set_sync_token("key", "token-1")
+            with state.transaction():
+                state.delete_event_state("key", "evt-1")
+            raise RuntimeError("boom")
+
+    assert state.get_sync_token("key") is None
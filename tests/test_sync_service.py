@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+import pytest
+
 from g2nc.models import CalendarChanges, CalendarEvent, CalendarMapping, UpsertResult
 from g2nc.ports import SyncTokenInvalidatedError
 from g2nc.state import SqliteStateRepository
@@ -148,3 +150,82 @@ def test_sync_resets_token_on_google_410(tmp_path: Path) -> None:
 
     assert google.calls == ["old-sync-token", None]
     assert state.get_sync_token(mapping.mapping_key) == "fresh-sync-token"
+
+
+@pytest.mark.parametrize("error", [RuntimeError("nextcloud down"), KeyboardInterrupt()])
+def test_sync_persists_applied_events_when_later_upsert_fails(
+    tmp_path: Path, error: BaseException
+) -> None:
+    mapping = _mapping()
+    state = _state(tmp_path)
+
+    class _FailingNextcloud(_NextcloudStub):
+        def upsert_event(
+            self,
+            calendar_url: str,
+            uid: str,
+            event: CalendarEvent,
+            known_href: str | None,
+            known_etag: str | None,
+        ) -> UpsertResult:
+            if event.google_event_id == "evt-2":
+                raise error
+            return super().upsert_event(calendar_url, uid, event, known_href, known_etag)
+
+    google = _GoogleStub(
+        sequences=[
+            CalendarChanges(events=(_event("evt-1"), _event("evt-2")), next_sync_token="sync-1")
+        ]
+    )
+    service = SyncService(google=google, nextcloud=_FailingNextcloud(), state=state)
+
+    with pytest.raises(type(error)):
+        service.sync_mapping(mapping)
+
+    assert state.get_event_state(mapping.mapping_key, "evt-1") is not None
+    assert state.get_event_state(mapping.mapping_key, "evt-2") is None
+    assert state.get_sync_token(mapping.mapping_key) is None
+
+
+def test_sync_flushes_event_state_in_batches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mapping = _mapping()
+    state = _state(tmp_path)
+    monkeypatch.setattr("g2nc.sync_service.STATE_FLUSH_BATCH_SIZE", 2)
+    reader = SqliteStateRepository(tmp_path / "state.sqlite")
+    persisted_before_upsert: list[list[str]] = []
+
+    class _ObservingNextcloud(_NextcloudStub):
+        def upsert_event(
+            self,
+            calendar_url: str,
+            uid: str,
+            event: CalendarEvent,
+            known_href: str | None,
+            known_etag: str | None,
+        ) -> UpsertResult:
+            persisted_before_upsert.append(
+                [
+                    event_id
+                    for event_id in ("evt-1", "evt-2", "evt-3")
+                    if reader.get_event_state(mapping.mapping_key, event_id) is not None
+                ]
+            )
+            return super().upsert_event(calendar_url, uid, event, known_href, known_etag)
+
+    google = _GoogleStub(
+        sequences=[
+            CalendarChanges(
+                events=(_event("evt-1"), _event("evt-2"), _event("evt-3")),
+                next_sync_token="sync-1",
+            )
+        ]
+    )
+    service = SyncService(google=google, nextcloud=_ObservingNextcloud(), state=state)
+
+    service.sync_mapping(mapping)
+
+    assert persisted_before_upsert == [[], [], ["evt-1", "evt-2"]]
+    assert reader.get_event_state(mapping.mapping_key, "evt-3") is not None
+    assert reader.get_sync_token(mapping.mapping_key) == "sync-1"
@@ -52,6 +52,22 @@ def test_render_ics_for_timed_event() -> None:
     assert "RRULE:FREQ=DAILY;COUNT=2" in ics
 
 
+def test_render_ics_escapes_backslash_before_other_specials() -> None:
+    event = CalendarEvent(
+        google_event_id="evt-3",
+        deleted=False,
+        title="C:\\temp;a,b",
+        description=None,
+        location=None,
+        start_raw="2026-01-02",
+        end_raw="2026-01-03",
+        all_day=True,
+        recurrence=(),
+    )
+
+    assert "SUMMARY:C:\\\\temp\\;a\\,b" in render_ics("uid-3", event)
+
+
 def test_render_ics_for_all_day_event() -> None:
     event = CalendarEvent(
         google_event_id="evt-2",
@@ -69,3 +85,27 @@ def test_render_ics_for_all_day_event() -> None:
 
     assert "DTSTART;VALUE=DATE:20260102" in ics
     assert "DTEND;VALUE=DATE:20260103" in ics
+
+
+def test_render_ics_folds_long_lines_on_utf8_boundaries() -> None:
+    description = "Agenda: " + "résumé review, " * 20
+    event = CalendarEvent(
+        google_event_id="evt-4",
+        deleted=False,
+        title="Planning",
+        description=description,
+        location=None,
+        start_raw="2026-01-02",
+        end_raw="2026-01-03",
+        all_day=True,
+        recurrence=(),
+    )
+
+    ics = render_ics("uid-4", event)
+    physical_lines = ics.split("\r\n")
+
+    assert all(len(line.encode("utf-8")) <= 75 for line in physical_lines)
+    assert any(line.startswith(" ") for line in physical_lines)
+    unfolded = ics.replace("\r\n ", "")
+    escaped = description.replace(",", "\\,")
+    assert f"DESCRIPTION:{escaped}\r\n" in unfolded